@@ -9,7 +9,7 @@ This example demonstrates how to:
 5. Integrate with GAME SDK for autonomous agents
 """
 
-from ..whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk import WhackRockFundManagerSDK, create_fund_manager_functions
+from ..whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk import get_fund_manager_sdk, create_fund_manager_functions
 from game_sdk.game.worker import Worker
 from game_sdk.game.custom_types import FunctionResult
 import os
@@ -23,7 +23,7 @@ def example_basic_usage():
     fund_address = "0x..."  # Replace with actual fund contract address
     
     # For read-only operations
-    sdk = WhackRockFundManagerSDK(
+    sdk = get_fund_manager_sdk(
         web3_provider=web3_provider,
         fund_contract_address=fund_address
     )
@@ -79,7 +79,7 @@ def example_with_write_operations():
     private_key = os.getenv("AGENT_PRIVATE_KEY")  # Load agent's private key from environment variable
     account_address = "0x..."  # Replace with agent's address
     
-    sdk = WhackRockFundManagerSDK(
+    sdk = get_fund_manager_sdk(
         web3_provider=web3_provider,
         fund_contract_address=fund_address,
         private_key=private_key,
@@ -106,7 +106,7 @@ def example_game_sdk_integration():
     web3_provider = "https://mainnet.infura.io/v3/YOUR_INFURA_KEY"
     fund_address = "0x..."
     
-    sdk = WhackRockFundManagerSDK(
+    sdk = get_fund_manager_sdk(
         web3_provider=web3_provider,
         fund_contract_address=fund_address
     )
@@ -8,21 +8,29 @@ Derives [VIRTUAL, cbBTC, USDC] weights from the latest Benjamin Cowen vide
 """
 
 import os, json, aiohttp, asyncio, logging
+from urllib.parse import quote, urlencode
 from pydantic import BaseModel, conlist
 from game_sdk.game.worker import Worker
 from game_sdk.game.custom_types import Function, Argument, FunctionResult, FunctionResultStatus
 from typing import Tuple
 
+logger = logging.getLogger(__name__)
+
 CHANNEL_ID = "ASDKFJPASKJDPOAISD"                      # Your favourite YouTuber's channel ID
-NUM_LLM_SIGNAL_ASSETS  = 3                             # 3 tokens: VIRTUAL, cbBTC, and USDC
+SIGNAL_ASSETS = ("VIRTUAL", "cbBTC", "USDC")          # fund token order, fixed at import
+NUM_LLM_SIGNAL_ASSETS  = len(SIGNAL_ASSETS)            # 3 tokens: VIRTUAL, cbBTC, and USDC
+FALLBACK_WEIGHTS = [0.34, 0.33, 0.33]                  # equal‑weight fallback
 
 class LLMSignal(BaseModel):
-    weightSignal: conlist(float, min_length=3, max_length=3)
+    weightSignal: conlist(float, min_length=NUM_LLM_SIGNAL_ASSETS, max_length=NUM_LLM_SIGNAL_ASSETS)
 
 YOUTUBE_TRANSCRIPT = (
     "https://r.jina.ai/http://youtubesubtitles.com/api/"
-    "v1/subtitles/%s?lang=en"                           # free transcript proxy
+    "v1/subtitles/%s?%s"                                # free transcript proxy
 )
+TRANSCRIPT_URL = YOUTUBE_TRANSCRIPT % (quote(CHANNEL_ID, safe=""), urlencode({"lang": "en"}))
+TRANSCRIPT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_TRANSCRIPT_CHARS = 48000                           # ~12k tokens, bounds LLM cost on long captions
 
 PROMPT = """You are an investment analyst. Summarise the video transcript.  
 Output **only** valid JSON:
@@ -34,9 +42,11 @@ Output **only** valid JSON:
 The weights must sum to exactly 1.00.  Here is the transcript:"""
 
 async def fetch_transcript(session) -> str:
-    async with session.get(YOUTUBE_TRANSCRIPT % CHANNEL_ID) as r:
+    async with session.get(TRANSCRIPT_URL, timeout=TRANSCRIPT_TIMEOUT) as r:
+        r.raise_for_status()
         data = await r.json()
-        return " ".join(item["text"] for item in data["subtitles"])
+        # join() materialises its input anyway; a list avoids the generator round-trip
+        return " ".join([item["text"] for item in data["subtitles"]])
 
 # Game SDK Worker for LLM analysis
 def create_signal_worker():
@@ -113,38 +123,77 @@ def create_signal_worker():
     
     return worker
 
+def run_signal_worker(transcript: str):
+    """Create the signal worker and run it on the transcript (blocking)"""
+    worker = create_signal_worker()
+    # The analyst instructions live in the worker's instruction, so the task
+    # only carries the transcript, trimmed to its most recent part
+    return worker.run(transcript[-MAX_TRANSCRIPT_CHARS:])
+
 async def derive_weights() -> list[float]:
     try:
         async with aiohttp.ClientSession() as sess:
             transcript = await fetch_transcript(sess)
 
-            # Use Game SDK worker for LLM analysis
-            worker = create_signal_worker()
-            result = worker.run(f"Please analyze this transcript and provide investment weights: {transcript}")
+        # Use Game SDK worker for LLM analysis; its HTTP calls are blocking,
+        # so run it in the default executor to keep the event loop free
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, run_signal_worker, transcript)
+        
+        # Parse the result - the worker should return JSON
+        # This is a simplified approach - in practice you'd need to parse the worker's response
+        if "weightSignal" in result:
+            parsed = json.loads(result)
+            sig = LLMSignal.model_validate(parsed)
+            return sig.weightSignal
+        else:
+            # Fallback if parsing fails
+            raise Exception("Failed to parse LLM response")
             
-            # Parse the result - the worker should return JSON
-            # This is a simplified approach - in practice you'd need to parse the worker's response
-            if "weightSignal" in result:
-                parsed = json.loads(result)
-                sig = LLMSignal.model_validate(parsed)
-                return sig.weightSignal
-            else:
-                # Fallback if parsing fails
-                raise Exception("Failed to parse LLM response")
-                
     except Exception as e:
-        logging.warning("BenFan signal fallback: %s", e)
-        return [0.34, 0.33, 0.33]                   # equal‑weight fallback
+        logger.warning("BenFan signal fallback: %s", e)
+        return list(FALLBACK_WEIGHTS)
+
+def weights_to_bps(weights: list[float]) -> list[int]:
+    """
+    Convert fractional weights to basis points summing to exactly 10000.
+    Weights are normalised, rounded, and the rounding residual is assigned to
+    the largest one, so float error (e.g. 0.29 * 10000 == 2899.99...) cannot
+    break the contract's sum check.
+    """
+    total = sum(weights)
+    if total <= 0:
+        weights, total = FALLBACK_WEIGHTS, sum(FALLBACK_WEIGHTS)
+    weights_bps = [round(w / total * 10000) for w in weights]
+    largest = max(range(len(weights_bps)), key=weights_bps.__getitem__)
+    weights_bps[largest] += 10000 - sum(weights_bps)
+    return weights_bps
+
+def describe_weights(weights: list[float]) -> str:
+    """
+    Format signal weights for reporting.
+    """
+    return "Benjamin Cowen signal: " + ", ".join(
+        f"{asset}={weight:.2%}" for asset, weight in zip(SIGNAL_ASSETS, weights)
+    )
+
+# Synchronous wrappers for game framework integration
+def get_signal() -> Tuple[list[int], str]:
+    """
+    Derive the signal once and return both the target weights in basis points
+    and its description, so callers needing both pay for a single
+    transcript fetch and LLM run.
+    """
+    weights = asyncio.run(derive_weights())
+    return weights_to_bps(weights), describe_weights(weights)
 
-# Synchronous wrapper for game framework integration
 def get_target_weights_bps() -> list[int]:
     """
     Get target weights in basis points (BPS) for game framework integration.
     Returns weights for [VIRTUAL, cbBTC, USDC] tokens.
     """
-    weights = asyncio.run(derive_weights())
-    # Convert to basis points (multiply by 10000)
-    return [int(w * 10000) for w in weights]
+    weights_bps, _ = get_signal()
+    return weights_bps
 
 def get_signal_description() -> str:
     """
@@ -152,7 +201,7 @@ def get_signal_description() -> str:
     """
     try:
         weights = asyncio.run(derive_weights())
-        return f"Benjamin Cowen signal: VIRTUAL={weights[0]:.2%}, cbBTC={weights[1]:.2%}, USDC={weights[2]:.2%}"
+        return describe_weights(weights)
     except Exception as e:
         return f"Benjamin Cowen signal (fallback): Equal weight allocation due to error: {e}"
 
@@ -160,5 +209,6 @@ def get_signal_description() -> str:
 if __name__ == "__main__":
     print("Testing signal generation...")
     print(f"Weights: {asyncio.run(derive_weights())}")
-    print(f"Weights (BPS): {get_target_weights_bps()}")
-    print(f"Description: {get_signal_description()}")
\ No newline at end of file
+    weights_bps, description = get_signal()
+    print(f"Weights (BPS): {weights_bps}")
+    print(f"Description: {description}")
\ No newline at end of file
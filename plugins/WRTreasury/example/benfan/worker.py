@@ -12,8 +12,8 @@ from game_sdk.game.worker import Worker
 from game_sdk.game.custom_types import Function, Argument, FunctionResult, FunctionResultStatus
 
 # Import our signal generator and fund manager SDK
-from .signal import get_target_weights_bps, get_signal_description
-from ..whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk import WhackRockFundManagerSDK
+from .signal import get_signal
+from ..whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk import get_fund_manager_sdk
 
 # Configuration - Replace with your actual values
 WEB3_PROVIDER = "https://mainnet.infura.io/v3/YOUR_INFURA_KEY"  # Replace with your RPC endpoint
@@ -25,7 +25,7 @@ def create_rebalance_worker():
     """Create a GAME SDK worker that rebalances a WhackRock fund based on signals"""
     
     # Initialize the fund manager SDK
-    fund_sdk = WhackRockFundManagerSDK(
+    fund_sdk = get_fund_manager_sdk(
         web3_provider=WEB3_PROVIDER,
         fund_contract_address=FUND_CONTRACT_ADDRESS,
         private_key=AGENT_PRIVATE_KEY,
@@ -38,12 +38,8 @@ def create_rebalance_worker():
         This is the only function this worker performs.
         """
         try:
-            # Get the current signal
-            target_weights_bps = get_target_weights_bps()
-            signal_description = get_signal_description()
-            
-            # Convert to comma-separated string format expected by the SDK
-            weights_str = ",".join(map(str, target_weights_bps))
+            # Get the current signal (weights and description from a single run)
+            target_weights_bps, signal_description = get_signal()
             
             # Set target weights and rebalance in one transaction
             result = fund_sdk.set_target_weights(
@@ -55,6 +51,8 @@ def create_rebalance_worker():
             if not result['success']:
                 return FunctionResultStatus.FAILED, f"Rebalancing failed: {result['error']}", result
             
+            result['signal'] = signal_description
+            
             # Success message
             message = f"Fund rebalanced successfully!\n"
             message += f"Signal: {signal_description}\n"
@@ -93,7 +91,7 @@ def create_rebalance_worker():
             current_state["last_rebalance"] = info.get("tx_hash")
             current_state["rebalance_count"] += 1
             current_state["last_weights"] = info.get("weights_set")
-            current_state["last_signal"] = get_signal_description()
+            current_state["last_signal"] = info.get("signal")
         
         return current_state
     
@@ -139,8 +137,7 @@ def run_rebalance_worker():
 
 if __name__ == "__main__":
     # Test the signal first
-    weights = get_target_weights_bps()
-    description = get_signal_description()
+    weights, description = get_signal()
     print(f"Current signal: {description}")
     print(f"Target weights: {weights}")
     
@@ -0,0 +1,270 @@
+import importlib.util
+import os
+
+import pytest
+from unittest.mock import Mock
+from eth_abi import encode
+from web3.exceptions import ContractLogicError
+
+import whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk as fund_manager
+from whackrock_plugin_gamesdk.whackrock_fund_manager_gamesdk import (
+    WhackRockFundManagerSDK,
+    compare_weights_many,
+    validate_weights_bps,
+)
+
+TOKENS = ['0x' + 'ab' * 20, '0x' + 'cd' * 20]
+TOKENS_CHECKSUMMED = [fund_manager._to_checksum_address(token) for token in TOKENS]
+AGENT_ADDRESS = '0x' + '33' * 20
+
+
+def load_signal_module():
+    """Load the BenFan signal module by path (its name shadows the stdlib signal module)"""
+    path = os.path.join(os.path.dirname(__file__), 'example', 'benfan', 'signal.py')
+    spec = importlib.util.spec_from_file_location('benfan_signal', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def encode_composition(weights_bps, tokens=TOKENS):
+    """ABI-encode a getCurrentCompositionBPS/getTargetCompositionBPS result"""
+    return encode(['uint256[]', 'address[]'], [weights_bps, tokens])
+
+
+def composition(weights_bps, tokens=TOKENS):
+    """Successful Multicall3 result for a composition read"""
+    return True, encode_composition(weights_bps, tokens)
+
+
+FAILED = (False, b'')
+
+
+def make_sdk(fund_address, web3_provider='http://localhost:8545', **kwargs):
+    """Create an SDK that never needs to ask the node for its chain ID"""
+    sdk = WhackRockFundManagerSDK(web3_provider, fund_address, **kwargs)
+    sdk._chain_id = 8453
+    return sdk
+
+
+def fake_multicall(compositions, log):
+    """
+    Build a _multicall replacement answering composition reads per fund
+
+    compositions maps a lowercase fund address to its (current, target)
+    Multicall3 results; every call batch is appended to log.
+    """
+    def multicall(calls):
+        log.append([target.lower() for target, _ in calls])
+        results = []
+        for target, selector in calls:
+            current, target_result = compositions[target.lower()]
+            results.append(current if selector == fund_manager.GET_CURRENT_COMPOSITION_SELECTOR else target_result)
+        return results
+    return multicall
+
+
+@pytest.fixture
+def token_cache(monkeypatch, tmp_path):
+    """Use an empty in-memory token cache saved under tmp_path"""
+    monkeypatch.setattr(fund_manager, 'TOKEN_CACHE_PATH', str(tmp_path / 'tokens.json'))
+    monkeypatch.setattr(fund_manager, '_token_cache', {})
+    monkeypatch.setattr(fund_manager, '_token_cache_dirty', False)
+    return fund_manager._token_cache
+
+
+def test_validate_weights_accepts_integral_weights():
+    """Test integer and integral float weights are accepted as ints"""
+    assert validate_weights_bps([5000, 3000, 2000]) == ([5000, 3000, 2000], None)
+    assert validate_weights_bps([5000.0, 5000]) == ([5000, 5000], None)
+
+
+@pytest.mark.parametrize('weights', [
+    [5000, 5000.9],
+    [float('inf')],
+    [float('nan')],
+    ['5000', 5000],
+    [None, 10000],
+])
+def test_validate_weights_rejects_non_integral_weights(weights):
+    """Test fractional, non-finite and non-numeric weights are rejected, not truncated"""
+    _, error = validate_weights_bps(weights)
+    assert error is not None
+    assert 'whole number of basis points' in error
+
+
+def test_validate_weights_quotes_rejected_strings():
+    """Test a rejected string weight is shown quoted so it does not look valid"""
+    _, error = validate_weights_bps(['5000', 5000])
+    assert "'5000'" in error
+
+
+@pytest.mark.parametrize('weights, message', [
+    ([], 'At least one weight'),
+    ([10001, -1], 'between 0 and 10000'),
+    ([-1, 10001], 'between 0 and 10000'),
+    ([5000, 4999], 'got 9999'),
+])
+def test_validate_weights_rejects_bounds_and_total(weights, message):
+    """Test empty lists, out-of-range weights and wrong totals are rejected"""
+    _, error = validate_weights_bps(weights)
+    assert message in error
+
+
+def test_set_target_weights_returns_error_for_infinite_weight():
+    """Test set_target_weights reports invalid input instead of raising"""
+    sdk = make_sdk('0x' + '11' * 20, private_key='0x' + '22' * 32, account_address=AGENT_ADDRESS)
+    result = sdk.set_target_weights([float('inf')])
+    assert result['success'] is False
+    assert 'whole number of basis points' in result['error']
+
+
+@pytest.mark.parametrize('weights, expected', [
+    ([0.5, 0.3, 0.2], [5000, 3000, 2000]),
+    ([0.29, 0.29, 0.42], [2900, 2900, 4200]),
+    ([1 / 3, 1 / 3, 1 / 3], [3334, 3333, 3333]),
+    ([2, 1, 1], [5000, 2500, 2500]),
+    ([0, 0, 0], [3400, 3300, 3300]),
+])
+def test_weights_to_bps(weights, expected):
+    """Test weights are normalised to basis points with the residual on the largest weight"""
+    signal = load_signal_module()
+    weights_bps = signal.weights_to_bps(weights)
+    assert weights_bps == expected
+    assert sum(weights_bps) == 10000
+
+
+def test_compare_weights_many_batches_per_endpoint_and_keeps_order():
+    """Test funds on one endpoint share a multicall and results follow input order"""
+    funds = ['0x' + '%02x' % i * 20 for i in range(1, 5)]
+    compositions = {
+        funds[0].lower(): (composition([6000, 4000]), composition([5000, 5000])),
+        funds[1].lower(): (composition([5000, 5000]), composition([5000, 5000])),
+        funds[2].lower(): (composition([5050, 4950]), composition([5000, 5000])),
+        funds[3].lower(): (composition([2000, 8000]), composition([5000, 5000])),
+    }
+    log = []
+    sdks = [
+        make_sdk(funds[0], 'http://rpc-a.invalid'),
+        make_sdk(funds[1], 'http://rpc-b.invalid'),
+        make_sdk(funds[2], 'http://rpc-a.invalid'),
+        make_sdk(funds[3], 'http://rpc-b.invalid'),
+    ]
+    for sdk in sdks:
+        sdk._multicall = fake_multicall(compositions, log)
+
+    results = compare_weights_many(sdks, threshold_bps=100)
+
+    assert [result['max_deviation_bps'] for result in results] == [1000, 0, 50, 3000]
+    assert [result['needs_rebalance'] for result in results] == [True, False, False, True]
+    assert results[0]['max_deviation_token_address'] == TOKENS_CHECKSUMMED[0]
+    assert sorted(sorted(set(calls)) for calls in log) == [
+        sorted([funds[0].lower(), funds[2].lower()]),
+        sorted([funds[1].lower(), funds[3].lower()]),
+    ]
+
+
+def test_compare_weights_many_isolates_fund_errors():
+    """Test a failed or inconsistent read only affects that fund's result"""
+    funds = ['0x' + '%02x' % i * 20 for i in range(1, 4)]
+    compositions = {
+        funds[0].lower(): (composition([6000, 4000]), composition([5000, 5000])),
+        funds[1].lower(): (composition([6000, 4000]), FAILED),
+        funds[2].lower(): (composition([6000, 4000]), composition([10000], TOKENS[:1])),
+    }
+    log = []
+    sdks = [make_sdk(fund) for fund in funds]
+    for sdk in sdks:
+        sdk._multicall = fake_multicall(compositions, log)
+
+    results = compare_weights_many(sdks)
+
+    assert len(log) == 1
+    assert results[0]['max_deviation_bps'] == 1000
+    assert results[1]['error'] == 'Failed to read target composition from fund contract'
+    assert results[1]['comparisons'] == []
+    assert 'different tokens' in results[2]['error']
+
+
+def test_compare_weights_many_reports_multicall_failure_per_group():
+    """Test an RPC failure on one endpoint does not affect funds on another"""
+    compositions = {'0x' + '01' * 20: (composition([6000, 4000]), composition([5000, 5000]))}
+    failing = make_sdk('0x' + '02' * 20, 'http://rpc-down.invalid')
+    failing._multicall = Mock(side_effect=ConnectionError('rpc down'))
+    working = make_sdk('0x' + '01' * 20, 'http://rpc-up.invalid')
+    working._multicall = fake_multicall(compositions, [])
+
+    results = compare_weights_many([failing, working])
+
+    assert results[0] == {'error': 'rpc down', 'comparisons': []}
+    assert results[1]['max_deviation_bps'] == 1000
+
+
+def test_compare_weights_many_empty():
+    """Test no funds means no work"""
+    assert compare_weights_many([]) == []
+
+
+def test_multicall_falls_back_to_direct_calls():
+    """Test view calls are sent one by one when Multicall3 is unavailable"""
+    fund = '0x' + '11' * 20
+    sdk = make_sdk(fund)
+    sdk.multicall_contract = Mock()
+    sdk.multicall_contract.functions.tryAggregate.return_value.call.side_effect = ValueError('no code')
+
+    def eth_call(transaction):
+        if transaction['data'] == fund_manager.GET_CURRENT_COMPOSITION_SELECTOR:
+            return encode_composition([6000, 4000])
+        raise ContractLogicError('execution reverted')
+    sdk.w3 = Mock()
+    sdk.w3.eth.call.side_effect = eth_call
+
+    results = sdk._multicall([
+        (fund, fund_manager.GET_CURRENT_COMPOSITION_SELECTOR),
+        (fund, fund_manager.GET_TARGET_COMPOSITION_SELECTOR),
+    ])
+
+    assert results == [composition([6000, 4000]), FAILED]
+
+
+def test_multicall_disabled_sends_direct_calls():
+    """Test multicall_address=None skips Multicall3 entirely"""
+    sdk = make_sdk('0x' + '11' * 20, multicall_address=None)
+    sdk.w3 = Mock()
+    sdk.w3.eth.call.return_value = b'\x00' * 32
+
+    assert sdk.multicall_contract is None
+    assert sdk._multicall([(sdk.fund_address, fund_manager.AGENT_SELECTOR)]) == [(True, b'\x00' * 32)]
+
+
+def test_get_token_info_does_not_cache_failed_reads(token_cache):
+    """Test reverted and empty token reads return None and are not cached"""
+    sdk = make_sdk('0x' + '11' * 20)
+    sdk._multicall = Mock(return_value=[
+        (True, encode(['string'], ['VIRTUAL'])),
+        (True, encode(['uint8'], [18])),
+        (True, b''),
+        (False, b''),
+    ])
+
+    result = sdk.get_token_info(TOKENS)
+
+    assert result['tokens'] == [
+        {'token_address': TOKENS_CHECKSUMMED[0], 'symbol': 'VIRTUAL', 'decimals': 18},
+        {'token_address': TOKENS_CHECKSUMMED[1], 'symbol': None, 'decimals': None},
+    ]
+    assert list(token_cache) == ['8453:' + TOKENS[0]]
+
+
+def test_get_token_info_returns_copies(token_cache):
+    """Test callers cannot modify the cached token metadata"""
+    sdk = make_sdk('0x' + '11' * 20)
+    sdk._multicall = Mock(return_value=[
+        (True, encode(['string'], ['VIRTUAL'])),
+        (True, encode(['uint8'], [18])),
+    ])
+
+    sdk.get_token_info(TOKENS[:1])['tokens'][0]['symbol'] = 'CHANGED'
+
+    assert sdk.get_token_info(TOKENS[:1])['tokens'][0]['symbol'] == 'VIRTUAL'
+    assert sdk._multicall.call_count == 1
@@ -6,10 +6,316 @@ specifically for getting current/target weights and triggering rebalancing.
 """
 
 from typing import Tuple, List, Dict, Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
-from web3.contract import Contract
+from web3.exceptions import ContractLogicError
+from eth_abi import decode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import atexit
+import hashlib
 import json
 import os
+import time
+
+
+# Minimal ABI for the fund functions used by the SDK
+FUND_ABI = [
+    {
+        "inputs": [],
+        "name": "getCurrentCompositionBPS",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "currentComposition_",
+                "type": "uint256[]"
+            },
+            {
+                "internalType": "address[]",
+                "name": "tokenAddresses_",
+                "type": "address[]"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getTargetCompositionBPS",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "targetComposition_",
+                "type": "uint256[]"
+            },
+            {
+                "internalType": "address[]",
+                "name": "tokenAddresses_",
+                "type": "address[]"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "triggerRebalance",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "agent",
+        "outputs": [
+            {
+                "internalType": "address",
+                "name": "",
+                "type": "address"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "totalNAVInAccountingAsset",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "totalManagedAssets",
+                "type": "uint256"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "totalNAVInUSDC",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "totalManagedAssetsInUSDC",
+                "type": "uint256"
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "_weights",
+                "type": "uint256[]"
+            }
+        ],
+        "name": "setTargetWeights",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "_weights",
+                "type": "uint256[]"
+            }
+        ],
+        "name": "setTargetWeightsAndRebalanceIfNeeded",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
+# Multicall3 is deployed at the same address on Ethereum, Base and most EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "internalType": "bool",
+                "name": "requireSuccess",
+                "type": "bool"
+            },
+            {
+                "components": [
+                    {
+                        "internalType": "address",
+                        "name": "target",
+                        "type": "address"
+                    },
+                    {
+                        "internalType": "bytes",
+                        "name": "callData",
+                        "type": "bytes"
+                    }
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {
+                        "internalType": "bool",
+                        "name": "success",
+                        "type": "bool"
+                    },
+                    {
+                        "internalType": "bytes",
+                        "name": "returnData",
+                        "type": "bytes"
+                    }
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+# Function selectors for fund view calls batched through Multicall3
+GET_CURRENT_COMPOSITION_SELECTOR = Web3.keccak(text="getCurrentCompositionBPS()")[:4]
+GET_TARGET_COMPOSITION_SELECTOR = Web3.keccak(text="getTargetCompositionBPS()")[:4]
+COMPOSITION_OUTPUT_TYPES = ['uint256[]', 'address[]']
+
+# On-disk cache of ERC-20 symbol/decimals, keyed by "<chain id>:<lowercase address>"
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "whackrock", "tokens.json")
+
+# Selectors for the fund info and ERC-20 metadata reads batched through Multicall3
+AGENT_SELECTOR = Web3.keccak(text="agent()")[:4]
+TOTAL_NAV_ACCOUNTING_SELECTOR = Web3.keccak(text="totalNAVInAccountingAsset()")[:4]
+TOTAL_NAV_USDC_SELECTOR = Web3.keccak(text="totalNAVInUSDC()")[:4]
+ERC20_SYMBOL_SELECTOR = Web3.keccak(text="symbol()")[:4]
+ERC20_DECIMALS_SELECTOR = Web3.keccak(text="decimals()")[:4]
+
+
+@lru_cache(maxsize=512)
+def _to_checksum_address(address: str) -> str:
+    """Checksum an address, memoizing the Keccak-256 hash for repeated addresses"""
+    return Web3.to_checksum_address(address)
+
+
+# Token metadata loaded lazily from TOKEN_CACHE_PATH and written back at exit
+_token_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_token_cache_dirty = False
+
+
+def _load_token_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the on-disk token cache on first use and register it to be saved at exit"""
+    global _token_cache
+    if _token_cache is None:
+        try:
+            with open(TOKEN_CACHE_PATH) as f:
+                _token_cache = json.load(f)
+        except (OSError, ValueError):
+            _token_cache = {}
+        atexit.register(_save_token_cache)
+    return _token_cache
+
+
+def _save_token_cache() -> None:
+    """Write the token cache back to disk if new tokens were resolved"""
+    if not _token_cache_dirty:
+        return
+    tmp_path = f'{TOKEN_CACHE_PATH}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+        # Write to a temporary file and swap it in so readers never see a partial file
+        with open(tmp_path, 'w') as f:
+            json.dump(_token_cache, f)
+        os.replace(tmp_path, TOKEN_CACHE_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# Last target composition read per (chain id, fund address), shared by every SDK
+# for the fund so a write through any of them invalidates it for all
+_target_compositions: Dict[Tuple[int, str], Tuple[float, List[int], List[str]]] = {}
+
+
+# Web3 instances shared by every SDK pointed at the same RPC endpoint
+_web3_instances: Dict[str, Web3] = {}
+
+
+def get_web3(web3_provider: str) -> Web3:
+    """
+    Get the shared Web3 instance for an RPC endpoint
+    
+    Each endpoint gets one pooled keep-alive requests session, so SDKs for
+    different funds on the same chain reuse the same TCP/TLS connections.
+    
+    Args:
+        web3_provider: Web3 RPC endpoint URL
+        
+    Returns:
+        Web3 instance backed by a pooled HTTP provider
+    """
+    w3 = _web3_instances.get(web3_provider)
+    if w3 is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=2)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        w3 = Web3(Web3.HTTPProvider(web3_provider, session=session))
+        _web3_instances[web3_provider] = w3
+    
+    return w3
+
+
+def validate_weights_bps(weights_bps: List[int]) -> Tuple[List[int], Optional[str]]:
+    """
+    Validate target weights before they are sent to the fund contract
+    
+    Weights are coerced once to the ints the ABI encoder expects, and bounds
+    and the total are checked in the same pass. Values with a fractional part
+    are rejected rather than truncated.
+    
+    Args:
+        weights_bps: List of target weights in basis points
+        
+    Returns:
+        Tuple of (weights as ints, error message or None if valid)
+    """
+    weights = []
+    for w in weights_bps:
+        try:
+            weight = int(w)
+        except (TypeError, ValueError, OverflowError):
+            weight = None
+        if weight is None or weight != w:
+            return weights, f'Each weight must be a whole number of basis points, got {w!r}'
+        weights.append(weight)
+    if not weights:
+        return weights, 'At least one weight is required'
+    
+    total_weight = 0
+    for weight in weights:
+        if weight < 0 or weight > 10000:
+            return weights, f'Each weight must be between 0 and 10000 basis points, got {weight}'
+        total_weight += weight
+    
+    # Validate weights sum to 10000 (100%)
+    if total_weight != 10000:
+        return weights, f'Weights must sum to 10000 basis points (100%), got {total_weight}'
+    
+    return weights, None
 
 
 class WhackRockFundManagerSDK:
@@ -20,7 +326,9 @@ class WhackRockFundManagerSDK:
         web3_provider: str,
         fund_contract_address: str,
         private_key: Optional[str] = None,
-        account_address: Optional[str] = None
+        account_address: Optional[str] = None,
+        multicall_address: Optional[str] = MULTICALL3_ADDRESS,
+        target_cache_ttl: float = 0.0
     ):
         """
         Initialize the WhackRock Fund Manager SDK
@@ -30,128 +338,177 @@ class WhackRockFundManagerSDK:
             fund_contract_address: Address of the WhackRockFundV6 contract
             private_key: Private key for signing transactions (optional, for write operations)
             account_address: Account address (optional, for write operations)
+            multicall_address: Address of the Multicall3 contract used to batch view calls
+                (None to send each view call separately, e.g. on chains without Multicall3)
+            target_cache_ttl: Seconds to reuse the last target composition read (default: 0, disabled)
         """
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider))
-        self.fund_address = Web3.to_checksum_address(fund_contract_address)
+        self.w3 = get_web3(web3_provider)
+        self.fund_address = _to_checksum_address(fund_contract_address)
         self.private_key = private_key
-        self.account_address = Web3.to_checksum_address(account_address) if account_address else None
+        self.account_address = _to_checksum_address(account_address) if account_address else None
         
-        # Initialize contract with minimal ABI for the 3 main functions
-        self.fund_abi = [
-            {
-                "inputs": [],
-                "name": "getCurrentCompositionBPS",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "currentComposition_",
-                        "type": "uint256[]"
-                    },
-                    {
-                        "internalType": "address[]",
-                        "name": "tokenAddresses_",
-                        "type": "address[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "getTargetCompositionBPS",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "targetComposition_",
-                        "type": "uint256[]"
-                    },
-                    {
-                        "internalType": "address[]",
-                        "name": "tokenAddresses_",
-                        "type": "address[]"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "triggerRebalance",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "agent",
-                "outputs": [
-                    {
-                        "internalType": "address",
-                        "name": "",
-                        "type": "address"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "totalNAVInAccountingAsset",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "totalManagedAssets",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "totalNAVInUSDC",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "totalManagedAssetsInUSDC",
-                        "type": "uint256"
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "_weights",
-                        "type": "uint256[]"
-                    }
-                ],
-                "name": "setTargetWeights",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "_weights",
-                        "type": "uint256[]"
-                    }
-                ],
-                "name": "setTargetWeightsAndRebalanceIfNeeded",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            }
-        ]
+        self.fund_abi = FUND_ABI
         
         self.fund_contract = self.w3.eth.contract(
             address=self.fund_address,
             abi=self.fund_abi
         )
+        
+        # Argument-free calls are built once and reused instead of being
+        # re-resolved from the ABI on every read
+        self._agent_call = self.fund_contract.functions.agent()
+        self._current_composition_call = self.fund_contract.functions.getCurrentCompositionBPS()
+        self._target_composition_call = self.fund_contract.functions.getTargetCompositionBPS()
+        self._trigger_rebalance_call = self.fund_contract.functions.triggerRebalance()
+        
+        self.multicall_contract = self.w3.eth.contract(
+            address=_to_checksum_address(multicall_address),
+            abi=MULTICALL3_ABI
+        ) if multicall_address else None
+        
+        # Target weights only change through setTargetWeights, so when enabled the last
+        # read is reused for a short window and dropped whenever any SDK for the fund sets them
+        self.target_cache_ttl = target_cache_ttl
+        
+        # Chain ID is read once on first use
+        self._chain_id: Optional[int] = None
+    
+    def _get_chain_id(self) -> int:
+        """Return the chain ID, reading it from the node only once"""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+    
+    def _send_transaction(self, contract_function: Any, gas_limit: int) -> Dict[str, Any]:
+        """
+        Build, sign and send a transaction from the agent account and wait for its receipt
+        
+        The nonce is read from the node's pending state on every write, since the
+        agent account may also send transactions for other funds. The chain ID is
+        cached.
+        
+        Args:
+            contract_function: Contract function call to send (e.g. functions.triggerRebalance())
+            gas_limit: Gas limit for the transaction
+            
+        Returns:
+            Transaction receipt
+        """
+        chain_id = self._get_chain_id()
+        nonce = self.w3.eth.get_transaction_count(self.account_address, 'pending')
+        
+        transaction = contract_function.build_transaction({
+            'from': self.account_address,
+            'chainId': chain_id,
+            'nonce': nonce,
+            'gas': gas_limit,
+            'gasPrice': self.w3.eth.gas_price
+        })
+        
+        # Sign and send the transaction
+        signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key=self.private_key)
+        raw_transaction = getattr(signed_txn, 'raw_transaction', None) or signed_txn.rawTransaction
+        tx_hash = self.w3.eth.send_raw_transaction(raw_transaction)
+        
+        # Wait for transaction receipt
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
+    
+    def _get_agent_address(self) -> str:
+        """Return the fund's checksummed agent address, read fresh so write checks see a recent setAgent"""
+        return _to_checksum_address(self._agent_call.call())
+    
+    def _target_cache_key(self) -> Tuple[int, str]:
+        """Key of this fund in the shared target composition cache"""
+        return self._get_chain_id(), self.fund_address
+    
+    def _get_cached_target(self) -> Optional[Tuple[List[int], List[str]]]:
+        """Return a copy of the cached (target_composition, token_addresses) if still fresh"""
+        if self.target_cache_ttl <= 0:
+            return None
+        
+        key = self._target_cache_key()
+        cached = _target_compositions.get(key)
+        if cached is None:
+            return None
+        
+        cached_at, target_composition, token_addresses = cached
+        if time.monotonic() - cached_at > self.target_cache_ttl:
+            _target_compositions.pop(key, None)
+            return None
+        
+        return list(target_composition), list(token_addresses)
+    
+    def _set_cached_target(self, target_composition: List[int], token_addresses: List[str]) -> None:
+        """Store a copy of a freshly read target composition"""
+        if self.target_cache_ttl > 0:
+            _target_compositions[self._target_cache_key()] = (
+                time.monotonic(), list(target_composition), list(token_addresses)
+            )
+    
+    def _clear_cached_target(self) -> None:
+        """Drop the cached target composition for this fund after its targets change"""
+        if self._chain_id is not None:
+            _target_compositions.pop((self._chain_id, self.fund_address), None)
+    
+    def _multicall(self, calls: List[Tuple[str, bytes]]) -> List[Tuple[bool, bytes]]:
+        """
+        Execute several view calls in a single eth_call through Multicall3
+        
+        If batching is disabled or the Multicall3 call fails (e.g. the contract
+        is not deployed on this chain), the calls are sent one by one instead.
+        
+        Args:
+            calls: List of (target address, call data) tuples
+            
+        Returns:
+            List of (success, return data) tuples in call order
+        """
+        if self.multicall_contract is not None:
+            try:
+                return self.multicall_contract.functions.tryAggregate(False, calls).call()
+            except Exception:
+                pass
+        
+        results = []
+        for target, call_data in calls:
+            try:
+                results.append((True, bytes(self.w3.eth.call({'to': target, 'data': call_data}))))
+            except ContractLogicError:
+                results.append((False, b''))
+        return results
+    
+    @staticmethod
+    def _format_composition(kind: str, composition_bps: List[int], token_addresses: List[str]) -> Dict[str, Any]:
+        """
+        Build the weights result for a composition returned by the contract
+        
+        Args:
+            kind: Either 'current' or 'target', used as the key prefix
+            composition_bps: Weights in basis points, in token order
+            token_addresses: Token addresses matching composition_bps
+            
+        Returns:
+            Dict in the format returned by get_current_weights/get_target_weights
+        """
+        weights_percent = []
+        tokens_with_weights = []
+        
+        # Convert weights from BPS to percentages and pair them with their tokens in one pass
+        for token_address, weight_bps in zip(token_addresses, composition_bps):
+            weight_percent = weight_bps / 100
+            weights_percent.append(weight_percent)
+            tokens_with_weights.append({
+                'token_address': token_address,
+                'weight_bps': weight_bps,
+                'weight_percent': weight_percent
+            })
+        
+        return {
+            'token_addresses': token_addresses,
+            f'{kind}_weights_bps': composition_bps,
+            f'{kind}_weights_percent': weights_percent,
+            'tokens_with_weights': tokens_with_weights
+        }
     
     def get_current_weights(self) -> Dict[str, Any]:
         """
@@ -166,26 +523,9 @@ class WhackRockFundManagerSDK:
         """
         try:
             # Call the contract function
-            current_composition, token_addresses = self.fund_contract.functions.getCurrentCompositionBPS().call()
-            
-            # Convert weights from BPS to percentages
-            current_weights_percent = [weight / 100 for weight in current_composition]
+            current_composition, token_addresses = self._current_composition_call.call()
             
-            # Create a combined list of tokens with their weights
-            tokens_with_weights = []
-            for i in range(len(token_addresses)):
-                tokens_with_weights.append({
-                    'token_address': token_addresses[i],
-                    'weight_bps': current_composition[i],
-                    'weight_percent': current_weights_percent[i]
-                })
-            
-            return {
-                'token_addresses': token_addresses,
-                'current_weights_bps': current_composition,
-                'current_weights_percent': current_weights_percent,
-                'tokens_with_weights': tokens_with_weights
-            }
+            return self._format_composition('current', current_composition, token_addresses)
             
         except Exception as e:
             return {
@@ -200,6 +540,10 @@ class WhackRockFundManagerSDK:
         """
         Get the target composition of the fund's assets
         
+        With a non-zero target_cache_ttl the result may be up to that many seconds
+        old. The cache is cleared by setTargetWeights sent through this process only,
+        so targets changed by another process are not seen until it expires.
+        
         Returns:
             Dict containing:
                 - token_addresses: List of token addresses
@@ -208,27 +552,15 @@ class WhackRockFundManagerSDK:
                 - tokens_with_weights: List of dicts with token address and weight info
         """
         try:
-            # Call the contract function
-            target_composition, token_addresses = self.fund_contract.functions.getTargetCompositionBPS().call()
-            
-            # Convert weights from BPS to percentages
-            target_weights_percent = [weight / 100 for weight in target_composition]
-            
-            # Create a combined list of tokens with their weights
-            tokens_with_weights = []
-            for i in range(len(token_addresses)):
-                tokens_with_weights.append({
-                    'token_address': token_addresses[i],
-                    'weight_bps': target_composition[i],
-                    'weight_percent': target_weights_percent[i]
-                })
+            cached = self._get_cached_target()
+            if cached is not None:
+                target_composition, token_addresses = cached
+            else:
+                # Call the contract function
+                target_composition, token_addresses = self._target_composition_call.call()
+                self._set_cached_target(target_composition, token_addresses)
             
-            return {
-                'token_addresses': token_addresses,
-                'target_weights_bps': target_composition,
-                'target_weights_percent': target_weights_percent,
-                'tokens_with_weights': tokens_with_weights
-            }
+            return self._format_composition('target', target_composition, token_addresses)
             
         except Exception as e:
             return {
@@ -239,49 +571,145 @@ class WhackRockFundManagerSDK:
                 'tokens_with_weights': []
             }
     
-    def compare_weights(self) -> Dict[str, Any]:
+    def _read_compositions(self) -> Tuple[Tuple[List[int], List[str]], Tuple[List[int], List[str]]]:
         """
-        Compare current weights with target weights to see deviations
+        Read the raw current and target compositions in a single RPC call
         
         Returns:
-            Dict containing weight comparison data for each token
+            Tuple of (current_composition, token_addresses) and (target_composition, token_addresses)
+        """
+        cached = self._get_cached_target()
+        if cached is not None:
+            # Target is still fresh, only the current composition needs a read
+            return self._current_composition_call.call(), cached
+        
+        results = self._multicall([
+            (self.fund_address, GET_CURRENT_COMPOSITION_SELECTOR),
+            (self.fund_address, GET_TARGET_COMPOSITION_SELECTOR)
+        ])
+        
+        current = self._decode_composition('current', *results[0])
+        target = self._decode_composition('target', *results[1])
+        self._set_cached_target(*target)
+        return current, target
+    
+    @staticmethod
+    def _decode_composition(kind: str, success: bool, return_data: bytes) -> Tuple[List[int], List[str]]:
+        """Decode a getCurrentCompositionBPS/getTargetCompositionBPS result returned through Multicall3"""
+        if not success:
+            raise ValueError(f'Failed to read {kind} composition from fund contract')
+        
+        composition_bps, token_addresses = decode(COMPOSITION_OUTPUT_TYPES, return_data)
+        return list(composition_bps), [_to_checksum_address(address) for address in token_addresses]
+    
+    def get_compositions_both(self) -> Dict[str, Any]:
+        """
+        Get the current and target compositions of the fund in a single RPC call
+        
+        Returns:
+            Dict containing:
+                - current: Result in the format of get_current_weights
+                - target: Result in the format of get_target_weights
         """
         try:
-            current = self.get_current_weights()
-            target = self.get_target_weights()
+            current, target = self._read_compositions()
+            return {
+                'current': self._format_composition('current', *current),
+                'target': self._format_composition('target', *target)
+            }
             
-            if 'error' in current or 'error' in target:
-                return {
-                    'error': current.get('error', target.get('error')),
-                    'comparisons': []
-                }
+        except Exception as e:
+            return {'error': str(e)}
+    
+    @staticmethod
+    def _decode_symbol(return_data: bytes) -> str:
+        """Decode an ERC-20 symbol() result, allowing for legacy bytes32 symbols"""
+        try:
+            (symbol,) = decode(['string'], return_data)
+            return symbol
+        except Exception:
+            return return_data[:32].rstrip(b'\x00').decode('utf-8', errors='replace')
+    
+    def get_token_info(self, token_addresses: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get the symbol and decimals of the fund's tokens in a single RPC call
+        
+        ERC-20 metadata never changes, so results are kept in a process-wide
+        cache persisted to TOKEN_CACHE_PATH and each token is only read once.
+        
+        Args:
+            token_addresses: Token addresses to look up (default: tokens in the current composition)
             
-            comparisons = []
-            for i in range(len(current['token_addresses'])):
-                current_bps = current['current_weights_bps'][i]
-                target_bps = target['target_weights_bps'][i]
-                deviation_bps = abs(current_bps - target_bps)
+        Returns:
+            Dict containing:
+                - tokens: List of dicts with token_address, symbol and decimals
+        """
+        try:
+            if token_addresses is None:
+                _, token_addresses = self._current_composition_call.call()
+            token_addresses = [_to_checksum_address(address) for address in token_addresses]
+            
+            token_cache = _load_token_cache()
+            chain_id = self._get_chain_id()
+            cache_keys = {address: f'{chain_id}:{address.lower()}' for address in token_addresses}
+            
+            # Batch symbol() and decimals() for every token not seen before
+            tokens = {key: token_cache[key] for key in cache_keys.values() if key in token_cache}
+            missing = [address for address, key in cache_keys.items() if key not in tokens]
+            if missing:
+                calls = []
+                for address in missing:
+                    calls.append((address, ERC20_SYMBOL_SELECTOR))
+                    calls.append((address, ERC20_DECIMALS_SELECTOR))
+                results = self._multicall(calls)
+                
+                resolved = False
+                for i, address in enumerate(missing):
+                    symbol_success, symbol_data = results[2 * i]
+                    decimals_success, decimals_data = results[2 * i + 1]
+                    # A call to an address without code succeeds with empty return data
+                    symbol_success = symbol_success and len(symbol_data) >= 32
+                    decimals_success = decimals_success and len(decimals_data) >= 32
+                    token = {
+                        'token_address': address,
+                        'symbol': self._decode_symbol(symbol_data) if symbol_success else None,
+                        'decimals': decode(['uint8'], decimals_data)[0] if decimals_success else None
+                    }
+                    tokens[cache_keys[address]] = token
+                    
+                    # Failed reads are returned as None but retried on the next lookup
+                    if symbol_success and decimals_success:
+                        token_cache[cache_keys[address]] = token
+                        resolved = True
                 
-                comparisons.append({
-                    'token_address': current['token_addresses'][i],
-                    'current_weight_bps': current_bps,
-                    'current_weight_percent': current['current_weights_percent'][i],
-                    'target_weight_bps': target_bps,
-                    'target_weight_percent': target['target_weights_percent'][i],
-                    'deviation_bps': deviation_bps,
-                    'deviation_percent': deviation_bps / 100,
-                    'needs_rebalance': deviation_bps > 100  # 1% threshold
-                })
+                if resolved:
+                    global _token_cache_dirty
+                    _token_cache_dirty = True
             
-            max_deviation_bps = max([c['deviation_bps'] for c in comparisons]) if comparisons else 0
-            needs_rebalance = max_deviation_bps > 100
+            # Copies, so callers cannot modify the cached entries
+            return {
+                'tokens': [dict(tokens[cache_keys[address]]) for address in token_addresses]
+            }
             
+        except Exception as e:
             return {
-                'comparisons': comparisons,
-                'max_deviation_bps': max_deviation_bps,
-                'max_deviation_percent': max_deviation_bps / 100,
-                'needs_rebalance': needs_rebalance
+                'error': str(e),
+                'tokens': []
             }
+    
+    def compare_weights(self, threshold_bps: int = 100) -> Dict[str, Any]:
+        """
+        Compare current weights with target weights to see deviations
+        
+        Args:
+            threshold_bps: Deviation in basis points above which a rebalance is needed (default: 100 = 1%)
+            
+        Returns:
+            Dict containing weight comparison data for each token
+        """
+        try:
+            current, target = self._read_compositions()
+            return self._compare_compositions(current, target, threshold_bps)
             
         except Exception as e:
             return {
@@ -289,6 +717,68 @@ class WhackRockFundManagerSDK:
                 'comparisons': []
             }
     
+    @staticmethod
+    def _compare_compositions(
+        current: Tuple[List[int], List[str]],
+        target: Tuple[List[int], List[str]],
+        threshold_bps: int
+    ) -> Dict[str, Any]:
+        """
+        Build the compare_weights result from raw current and target compositions
+        
+        Args:
+            current: (current_composition, token_addresses) as read from the contract
+            target: (target_composition, token_addresses) as read from the contract
+            threshold_bps: Deviation in basis points above which a rebalance is needed
+            
+        Returns:
+            Dict in the format returned by compare_weights (raises ValueError if the
+            compositions do not cover the same tokens)
+        """
+        current_composition, token_addresses = current
+        target_composition, target_token_addresses = target
+        
+        # The contract reports both compositions over the same token list
+        if (len(current_composition) != len(token_addresses)
+                or len(target_composition) != len(target_token_addresses)):
+            raise ValueError('Fund returned a composition whose weights and tokens differ in length')
+        if list(token_addresses) != list(target_token_addresses):
+            raise ValueError('Current and target compositions list different tokens')
+        
+        # Single pass over the raw compositions: percentages, deviations
+        # and the largest deviation are all computed here
+        comparisons = []
+        max_deviation_bps = 0
+        max_deviation_token = None
+        for token_address, current_bps, target_bps in zip(token_addresses, current_composition, target_composition):
+            deviation_bps = abs(current_bps - target_bps)
+            
+            # Track the largest deviation while building comparisons
+            if max_deviation_token is None or deviation_bps > max_deviation_bps:
+                max_deviation_bps = deviation_bps
+                max_deviation_token = token_address
+            
+            comparisons.append({
+                'token_address': token_address,
+                'current_weight_bps': current_bps,
+                'current_weight_percent': current_bps / 100,
+                'target_weight_bps': target_bps,
+                'target_weight_percent': target_bps / 100,
+                'deviation_bps': deviation_bps,
+                'deviation_percent': deviation_bps / 100,
+                'needs_rebalance': deviation_bps > threshold_bps
+            })
+        
+        needs_rebalance = max_deviation_bps > threshold_bps
+        
+        return {
+            'comparisons': comparisons,
+            'max_deviation_bps': max_deviation_bps,
+            'max_deviation_percent': max_deviation_bps / 100,
+            'max_deviation_token_address': max_deviation_token,
+            'needs_rebalance': needs_rebalance
+        }
+    
     def trigger_rebalance(self, gas_limit: int = 500000) -> Dict[str, Any]:
         """
         Trigger a rebalance of the fund's assets
@@ -307,30 +797,14 @@ class WhackRockFundManagerSDK:
         
         try:
             # Check if caller is the agent
-            agent_address = self.fund_contract.functions.agent().call()
-            if self.account_address.lower() != agent_address.lower():
+            agent_address = self._get_agent_address()
+            if self.account_address != agent_address:
                 return {
                     'error': f'Only the agent ({agent_address}) can trigger rebalance',
                     'success': False
                 }
             
-            # Build the transaction
-            nonce = self.w3.eth.get_transaction_count(self.account_address)
-            gas_price = self.w3.eth.gas_price
-            
-            transaction = self.fund_contract.functions.triggerRebalance().build_transaction({
-                'from': self.account_address,
-                'nonce': nonce,
-                'gas': gas_limit,
-                'gasPrice': gas_price
-            })
-            
-            # Sign and send the transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key=self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-            
-            # Wait for transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = self._send_transaction(self._trigger_rebalance_call, gas_limit)
             
             return {
                 'success': True,
@@ -364,49 +838,32 @@ class WhackRockFundManagerSDK:
                 'success': False
             }
         
-        # Validate weights sum to 10000 (100%)
-        total_weight = sum(weights_bps)
-        if total_weight != 10000:
+        weights_bps, error = validate_weights_bps(weights_bps)
+        if error:
             return {
-                'error': f'Weights must sum to 10000 basis points (100%), got {total_weight}',
+                'error': error,
                 'success': False
             }
         
         try:
             # Check if caller is the agent
-            agent_address = self.fund_contract.functions.agent().call()
-            if self.account_address.lower() != agent_address.lower():
+            agent_address = self._get_agent_address()
+            if self.account_address != agent_address:
                 return {
                     'error': f'Only the agent ({agent_address}) can set target weights',
                     'success': False
                 }
             
-            # Build the transaction
-            nonce = self.w3.eth.get_transaction_count(self.account_address)
-            gas_price = self.w3.eth.gas_price
-            
             # Choose function based on rebalance_if_needed parameter
             if rebalance_if_needed:
-                transaction = self.fund_contract.functions.setTargetWeightsAndRebalanceIfNeeded(weights_bps).build_transaction({
-                    'from': self.account_address,
-                    'nonce': nonce,
-                    'gas': gas_limit,
-                    'gasPrice': gas_price
-                })
+                contract_function = self.fund_contract.functions.setTargetWeightsAndRebalanceIfNeeded(weights_bps)
             else:
-                transaction = self.fund_contract.functions.setTargetWeights(weights_bps).build_transaction({
-                    'from': self.account_address,
-                    'nonce': nonce,
-                    'gas': gas_limit,
-                    'gasPrice': gas_price
-                })
+                contract_function = self.fund_contract.functions.setTargetWeights(weights_bps)
             
-            # Sign and send the transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key=self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            receipt = self._send_transaction(contract_function, gas_limit)
             
-            # Wait for transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            # Targets changed on-chain, next read by any SDK for this fund must hit the contract
+            self._clear_cached_target()
             
             return {
                 'success': True,
@@ -432,15 +889,25 @@ class WhackRockFundManagerSDK:
             Dict containing fund information
         """
         try:
-            agent = self.fund_contract.functions.agent().call()
-            nav_weth = self.fund_contract.functions.totalNAVInAccountingAsset().call()
-            nav_usdc = self.fund_contract.functions.totalNAVInUSDC().call()
+            # Read agent and both NAV figures in a single eth_call
+            results = self._multicall([
+                (self.fund_address, AGENT_SELECTOR),
+                (self.fund_address, TOTAL_NAV_ACCOUNTING_SELECTOR),
+                (self.fund_address, TOTAL_NAV_USDC_SELECTOR)
+            ])
+            if not all(success for success, _ in results):
+                raise ValueError('Failed to read fund info from fund contract')
+            
+            (agent,) = decode(['address'], results[0][1])
+            (nav_weth,) = decode(['uint256'], results[1][1])
+            (nav_usdc,) = decode(['uint256'], results[2][1])
+            agent = _to_checksum_address(agent)
             
             return {
                 'fund_address': self.fund_address,
                 'agent_address': agent,
                 'total_nav_weth': nav_weth,
-                'total_nav_weth_formatted': self.w3.from_wei(nav_weth, 'ether'),
+                'total_nav_weth_formatted': nav_weth / 1e18,  # WETH has 18 decimals
                 'total_nav_usdc': nav_usdc,
                 'total_nav_usdc_formatted': nav_usdc / 1e6  # USDC has 6 decimals
             }
@@ -452,6 +919,131 @@ class WhackRockFundManagerSDK:
             }
 
 
+# Maximum number of SDK instances kept by get_fund_manager_sdk
+SDK_CACHE_SIZE = 32
+
+# Shared SDK instances, keyed by (provider, fund, private key hash, account,
+# multicall address, target cache TTL) and ordered from least to most recently used
+_sdk_cache: "OrderedDict[Tuple[str, str, Optional[str], Optional[str], Optional[str], float], WhackRockFundManagerSDK]" = OrderedDict()
+
+
+def get_fund_manager_sdk(
+    web3_provider: str,
+    fund_contract_address: str,
+    private_key: Optional[str] = None,
+    account_address: Optional[str] = None,
+    multicall_address: Optional[str] = MULTICALL3_ADDRESS,
+    target_cache_ttl: float = 0.0
+) -> WhackRockFundManagerSDK:
+    """
+    Get a shared WhackRockFundManagerSDK instance for the given configuration
+    
+    Agents that build their action space repeatedly reuse the same SDK (and its
+    Web3 HTTP provider) instead of creating a new one on every call. At most
+    SDK_CACHE_SIZE instances are kept; the least recently used one is dropped.
+    
+    Args:
+        web3_provider: Web3 RPC endpoint URL
+        fund_contract_address: Address of the WhackRockFundV6 contract
+        private_key: Private key for signing transactions (optional, for write operations)
+        account_address: Account address (optional, for write operations)
+        multicall_address: Address of the Multicall3 contract used to batch view calls (None disables batching)
+        target_cache_ttl: Seconds to reuse the last target composition read (default: 0, disabled)
+        
+    Returns:
+        Cached instance of WhackRockFundManagerSDK
+    """
+    key_hash = hashlib.sha256(private_key.encode()).hexdigest() if private_key else None
+    cache_key = (
+        web3_provider,
+        fund_contract_address.lower(),
+        key_hash,
+        account_address.lower() if account_address else None,
+        multicall_address.lower() if multicall_address else None,
+        target_cache_ttl
+    )
+    
+    sdk = _sdk_cache.get(cache_key)
+    if sdk is None:
+        sdk = WhackRockFundManagerSDK(
+            web3_provider=web3_provider,
+            fund_contract_address=fund_contract_address,
+            private_key=private_key,
+            account_address=account_address,
+            multicall_address=multicall_address,
+            target_cache_ttl=target_cache_ttl
+        )
+        _sdk_cache[cache_key] = sdk
+        if len(_sdk_cache) > SDK_CACHE_SIZE:
+            _sdk_cache.popitem(last=False)
+    else:
+        _sdk_cache.move_to_end(cache_key)
+    
+    return sdk
+
+
+def _compare_weights_group(sdks: List[WhackRockFundManagerSDK], threshold_bps: int) -> List[Dict[str, Any]]:
+    """Compare weights for funds sharing an RPC endpoint with a single Multicall3 call"""
+    calls = []
+    for sdk in sdks:
+        calls.append((sdk.fund_address, GET_CURRENT_COMPOSITION_SELECTOR))
+        calls.append((sdk.fund_address, GET_TARGET_COMPOSITION_SELECTOR))
+    
+    try:
+        results = sdks[0]._multicall(calls)
+    except Exception as e:
+        return [{'error': str(e), 'comparisons': []} for _ in sdks]
+    
+    comparisons = []
+    for i, sdk in enumerate(sdks):
+        try:
+            current = sdk._decode_composition('current', *results[2 * i])
+            target = sdk._decode_composition('target', *results[2 * i + 1])
+            sdk._set_cached_target(*target)
+            comparisons.append(sdk._compare_compositions(current, target, threshold_bps))
+        except Exception as e:
+            comparisons.append({'error': str(e), 'comparisons': []})
+    
+    return comparisons
+
+
+def compare_weights_many(sdks: List[WhackRockFundManagerSDK], threshold_bps: int = 100) -> List[Dict[str, Any]]:
+    """
+    Compare current and target weights for several funds
+    
+    Funds on the same RPC endpoint are read with a single Multicall3 call, and
+    different endpoints are queried concurrently, so checking N funds takes
+    roughly one round-trip instead of N sequential ones.
+    
+    Args:
+        sdks: SDK instances, one per fund
+        threshold_bps: Deviation in basis points above which a rebalance is needed (default: 100 = 1%)
+        
+    Returns:
+        List of compare_weights results in the same order as sdks
+    """
+    if not sdks:
+        return []
+    
+    # Group funds by shared Web3 instance and Multicall3 contract
+    groups: Dict[Tuple[int, Optional[str]], List[int]] = {}
+    for i, sdk in enumerate(sdks):
+        multicall_address = sdk.multicall_contract.address if sdk.multicall_contract is not None else None
+        groups.setdefault((id(sdk.w3), multicall_address), []).append(i)
+    
+    results: List[Dict[str, Any]] = [{} for _ in sdks]
+    with ThreadPoolExecutor(max_workers=min(len(groups), 16)) as executor:
+        futures = {
+            executor.submit(_compare_weights_group, [sdks[i] for i in indices], threshold_bps): indices
+            for indices in groups.values()
+        }
+        for future, indices in futures.items():
+            for i, result in zip(indices, future.result()):
+                results[i] = result
+    
+    return results
+
+
 # Helper functions for GAME SDK integration
 def create_fund_manager_functions(sdk: WhackRockFundManagerSDK) -> List[Dict[str, Any]]:
     """
@@ -463,7 +1055,7 @@ def create_fund_manager_functions(sdk: WhackRockFundManagerSDK) -> List[Dict[str
     Returns:
         List of function definitions for GAME SDK action space
     """
-    from game_sdk.game.custom_types import Function, Argument, FunctionResult, FunctionResultStatus
+    from game_sdk.game.custom_types import Function, Argument, FunctionResultStatus
     
     def get_current_weights(**kwargs) -> Tuple[FunctionResultStatus, str, dict]:
         """Get current asset weights of the fund"""
@@ -489,9 +1081,9 @@ def create_fund_manager_functions(sdk: WhackRockFundManagerSDK) -> List[Dict[str
         
         return FunctionResultStatus.DONE, message, result
     
-    def check_rebalance_needed(**kwargs) -> Tuple[FunctionResultStatus, str, dict]:
+    def check_rebalance_needed(threshold_bps: int = 100, **kwargs) -> Tuple[FunctionResultStatus, str, dict]:
         """Check if the fund needs rebalancing"""
-        result = sdk.compare_weights()
+        result = sdk.compare_weights(int(threshold_bps))
         if 'error' in result:
             return FunctionResultStatus.FAILED, f"Failed to compare weights: {result['error']}", {}
         
@@ -521,8 +1113,8 @@ def create_fund_manager_functions(sdk: WhackRockFundManagerSDK) -> List[Dict[str
     def set_target_weights(weights_bps: str, rebalance_if_needed: bool = False, gas_limit: int = 500000, **kwargs) -> Tuple[FunctionResultStatus, str, dict]:
         """Set new target weights for the fund"""
         try:
-            # Parse weights from comma-separated string to list of integers
-            weights_list = [int(w.strip()) for w in weights_bps.split(',')]
+            # Parse weights from comma-separated string to list of integers (int() ignores surrounding whitespace)
+            weights_list = [int(w) for w in weights_bps.split(',')]
         except ValueError:
             return FunctionResultStatus.FAILED, "Invalid weights format. Use comma-separated integers (e.g., '5000,3000,2000')", {}
         
@@ -570,7 +1162,13 @@ def create_fund_manager_functions(sdk: WhackRockFundManagerSDK) -> List[Dict[str
         Function(
             fn_name="check_rebalance_needed",
             fn_description="Check if the fund needs rebalancing by comparing current vs target weights",
-            args=[],
+            args=[
+                Argument(
+                    name="threshold_bps",
+                    type="integer",
+                    description="Deviation in basis points above which a rebalance is needed (default: 100 = 1%)"
+                )
+            ],
             executable=check_rebalance_needed
         ),
         Function(